@@ -1,160 +1,220 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+import asyncio
+import functools
 import logging
 from validation import FunctionSchema, FunctionValidator, ValidationError, ParameterType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (function, schema, compiled parameter validator)
+RegistryEntry = Tuple[Callable, FunctionSchema, Callable[[Dict[str, Any]], None]]
+
 class FunctionRegistry:
     """Registry for managing function definitions and their schemas."""
     def __init__(self):
-        self._functions: Dict[str, Callable] = {}
-        self._schemas: Dict[str, FunctionSchema] = {}
-
-    def register(self, name: str, func: Callable, schema: Dict[str, Any]) -> None:
-        """Register a function with its schema."""
-        if name in self._functions:
+        self._entries: Dict[str, RegistryEntry] = {}
+        self._prompt_lines: Dict[str, str] = {}
+        self._listing: Dict[str, Tuple[str, str]] = {}
+        self._listing_cache: Tuple[Tuple[str, str], ...] = ()
+        self._listing_version = 0
+        self._version = 0
+
+    def register(self, name: str, func: Callable, schema: Dict[str, Any],
+                 validated: bool = False) -> None:
+        """Register a function with its schema.
+
+        Pass validated=True only if the schema has already been checked with
+        FunctionValidator.validate_function_definition.
+        """
+        if name in self._entries:
             raise ValidationError(f"Function '{name}' is already registered")
-        
-        try:
-            # Validate the function definition
-            FunctionValidator.validate_function_definition(schema)
-            
-            # Create and store the schema
-            function_schema = FunctionSchema(
-                name=schema["name"],
-                description=schema["description"],
-                parameters=schema["parameters"],
-                required=schema.get("required", [])
-            )
-            
-            self._schemas[name] = function_schema
-            self._functions[name] = func
-            logger.info(f"Successfully registered function: {name}")
-            
-        except ValidationError as e:
-            logger.error(f"Failed to register function {name}: {str(e)}")
-            raise
+
+        function_schema = self._build_schema(name, schema, validated)
+        self._store(name, func, schema, function_schema)
+        logger.info("Successfully registered function: %s", name)
 
     def unregister(self, name: str) -> None:
         """Remove a function from the registry."""
-        if name not in self._functions:
+        if self._entries.pop(name, None) is None:
             raise ValueError(f"Function {name} not found in registry")
-        
-        del self._functions[name]
-        del self._schemas[name]
-        logger.info(f"Successfully unregistered function: {name}")
-
-    def update_function(self, name: str, new_func: Callable, new_schema: Dict[str, Any]) -> None:
-        """Update an existing function's implementation and schema."""
-        if name not in self._functions:
+
+        del self._prompt_lines[name]
+        del self._listing[name]
+        self._version += 1
+        logger.info("Successfully unregistered function: %s", name)
+
+    def update_function(self, name: str, new_func: Callable, new_schema: Dict[str, Any],
+                        validated: bool = False) -> None:
+        """Update an existing function's implementation and schema.
+
+        Pass validated=True only if the schema has already been checked with
+        FunctionValidator.validate_function_definition.
+        """
+        if name not in self._entries:
             raise ValueError(f"Function {name} not found in registry")
-        
+
+        function_schema = self._build_schema(name, new_schema, validated)
+        self._store(name, new_func, new_schema, function_schema)
+        logger.info("Successfully updated function: %s", name)
+
+    @staticmethod
+    def _build_schema(name: str, schema: Dict[str, Any], validated: bool = False) -> FunctionSchema:
+        """Validate a function definition and build its FunctionSchema."""
         try:
-            # Validate the new schema
-            FunctionValidator.validate_function_definition(new_schema)
-            
-            # Create and store the new schema
-            function_schema = FunctionSchema(
-                name=new_schema["name"],
-                description=new_schema["description"],
-                parameters=new_schema["parameters"],
-                required=new_schema.get("required", [])
+            if not validated:
+                FunctionValidator.validate_function_definition(schema)
+
+            return FunctionSchema(
+                name=schema["name"],
+                description=schema["description"],
+                parameters=schema["parameters"],
+                required=schema.get("required", [])
             )
-            
-            self._schemas[name] = function_schema
-            self._functions[name] = new_func
-            logger.info(f"Successfully updated function: {name}")
-            
         except ValidationError as e:
-            logger.error(f"Failed to update function {name}: {str(e)}")
+            logger.error("Invalid definition for function %s: %s", name, e)
             raise
 
+    def _store(self, name: str, func: Callable, schema: Dict[str, Any],
+               function_schema: FunctionSchema) -> None:
+        """Store a function entry and refresh its cached prompt and listing rows."""
+        validator = FunctionValidator.compile_validator(schema)
+        self._entries[name] = (func, function_schema, validator)
+        self._prompt_lines[name] = f"- {name}: {function_schema.description}\n"
+        self._listing[name] = (name, function_schema.description)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registry mutation."""
+        return self._version
+
+    def get_entry(self, name: str) -> Optional[RegistryEntry]:
+        """Get a function, its schema and compiled validator with a single lookup."""
+        return self._entries.get(name)
+
     def get_function(self, name: str) -> Optional[Callable]:
         """Get a function by name."""
-        return self._functions.get(name)
+        entry = self._entries.get(name)
+        return entry[0] if entry is not None else None
 
     def get_schema(self, name: str) -> Optional[FunctionSchema]:
         """Get a function's schema by name."""
-        return self._schemas.get(name)
+        entry = self._entries.get(name)
+        return entry[1] if entry is not None else None
+
+    def list_functions(self) -> Tuple[Tuple[str, str], ...]:
+        """List all registered functions as (name, description) pairs.
 
-    def list_functions(self) -> List[Dict[str, str]]:
-        """List all registered functions with their descriptions."""
-        return [
-            {"name": name, "description": schema.description}
-            for name, schema in self._schemas.items()
-        ]
+        The pairs are maintained on every mutation; the returned tuple is
+        snapshotted once per registry version.
+        """
+        if self._listing_version != self._version:
+            self._listing_cache = tuple(self._listing.values())
+            self._listing_version = self._version
+        return self._listing_cache
 
 class GemmaFunctionCaller:
     """Main class for handling function calls with the Gemma model."""
-    def __init__(self, registry: FunctionRegistry):
+    def __init__(self, registry: FunctionRegistry, executor: Optional[Executor] = None):
         self.registry = registry
-        self._system_prompt = self._build_system_prompt()
+        self._executor = executor
+        self.update_system_prompt()
 
     def _build_system_prompt(self) -> str:
         """Build the system prompt listing available functions."""
-        functions = self.registry.list_functions()
-        if not functions:
+        lines = self.registry._prompt_lines
+        if not lines:
             return "No functions are currently available."
 
-        prompt = "Available functions:\n\n"
-        for func in functions:
-            prompt += f"- {func['name']}: {func['description']}\n"
-        return prompt
+        return "Available functions:\n\n" + "".join(lines.values())
 
     def update_system_prompt(self) -> None:
-        """Update the system prompt when functions change."""
+        """Rebuild the system prompt from the registry's cached lines."""
+        self._prompt_version = self.registry.version
         self._system_prompt = self._build_system_prompt()
 
     def call_function(self, name: str, parameters: Dict[str, Any], max_retries: int = 3) -> Any:
-        """Call a registered function with the given parameters."""
-        function = self.registry.get_function(name)
-        if not function:
-            raise ValueError(f"Function {name} not found")
-
-        schema = self.registry.get_schema(name)
-        if not schema:
-            raise ValueError(f"Schema for function {name} not found")
-
-        # Validate parameters
-        try:
-            schema.validate_parameters(parameters)
-        except ValidationError as e:
-            logger.error(f"Parameter validation failed for {name}: {str(e)}")
-            raise
+        """Call a registered function with the given parameters.
+
+        With max_retries=1 the function is called once and any exception it
+        raises propagates unchanged instead of being wrapped in RuntimeError.
+        """
+        function = self._prepare_call(name, parameters)
+        return self._invoke(name, function, parameters, max_retries)
+
+    async def call_function_async(self, name: str, parameters: Dict[str, Any], max_retries: int = 3) -> Any:
+        """Call a registered function on the executor without blocking the event loop.
+
+        Parameters are validated on the event loop; the function and any
+        retries then run on the executor passed to the constructor, or the
+        event loop's default executor, so it must be thread-safe. Retry
+        behaviour matches call_function.
+        """
+        function = self._prepare_call(name, parameters)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._invoke, name, function, parameters, max_retries),
+        )
+
+    @staticmethod
+    def _invoke(name: str, function: Callable, parameters: Dict[str, Any], max_retries: int) -> Any:
+        """Call a validated function, retrying failures up to max_retries attempts."""
+        if max_retries == 1:
+            result = function(**parameters)
+            logger.info("Successfully called function %s", name)
+            return result
 
         # Execute function with retry logic
-        retries = 0
         last_error = None
 
-        while retries < max_retries:
+        for attempt in range(1, max_retries + 1):
             try:
                 result = function(**parameters)
-                logger.info(f"Successfully called function {name}")
+                logger.info("Successfully called function %s", name)
                 return result
             except Exception as e:
                 last_error = e
-                retries += 1
-                logger.warning(f"Attempt {retries} failed for {name}: {str(e)}")
+                logger.warning("Attempt %d failed for %s: %s", attempt, name, e)
 
-        logger.error(f"Function {name} failed after {max_retries} attempts")
+        logger.error("Function %s failed after %d attempts", name, max_retries)
         raise RuntimeError(f"Function execution failed: {str(last_error)}")
 
+    def _prepare_call(self, name: str, parameters: Dict[str, Any]) -> Callable:
+        """Look up a registered function and validate the call parameters."""
+        entry = self.registry._entries.get(name)
+        if entry is None:
+            raise ValueError(f"Function {name} not found")
+        function, _, validator = entry
+
+        # Validate parameters
+        try:
+            validator(parameters)
+        except ValidationError as e:
+            if e.param is None:
+                logger.error("Parameter validation failed for %s: %s", name, e)
+            else:
+                logger.error("Parameter validation failed for %s, parameter %r: %s", name, e.param, e)
+            raise
+        return function
+
     def get_system_prompt(self) -> str:
-        """Get the current system prompt."""
+        """Get the current system prompt, rebuilding it if the registry changed."""
+        if self._prompt_version != self.registry.version:
+            self.update_system_prompt()
         return self._system_prompt
 
-    def register_function(self, name: str, func: Callable, schema: Dict[str, Any]) -> None:
-        """Register a new function and update the system prompt."""
-        self.registry.register(name, func, schema)
-        self.update_system_prompt()
+    def register_function(self, name: str, func: Callable, schema: Dict[str, Any],
+                          validated: bool = False) -> None:
+        """Register a new function; the system prompt picks it up lazily."""
+        self.registry.register(name, func, schema, validated=validated)
 
     def unregister_function(self, name: str) -> None:
-        """Unregister a function and update the system prompt."""
+        """Unregister a function; the system prompt drops it lazily."""
         self.registry.unregister(name)
-        self.update_system_prompt()
 
-    def update_function(self, name: str, new_func: Callable, new_schema: Dict[str, Any]) -> None:
-        """Update an existing function and update the system prompt."""
-        self.registry.update_function(name, new_func, new_schema)
-        self.update_system_prompt() 
\ No newline at end of file
+    def update_function(self, name: str, new_func: Callable, new_schema: Dict[str, Any],
+                        validated: bool = False) -> None:
+        """Update an existing function; the system prompt is refreshed lazily."""
+        self.registry.update_function(name, new_func, new_schema, validated=validated) 
\ No newline at end of file
@@ -0,0 +1,12 @@
+import pytest
+import responses
+
+@pytest.fixture(autouse=True)
+def mocked_responses():
+    """Intercept all HTTP traffic made through requests during each test.
+
+    Unregistered URLs raise ConnectionError instead of reaching the network.
+    Tests that need canned responses register them on this fixture.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
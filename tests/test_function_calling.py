@@ -1,5 +1,6 @@
 import pytest
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 from function_calling import FunctionRegistry, GemmaFunctionCaller
 from validation import ValidationError, ParameterType
 
@@ -36,6 +37,10 @@ def test_function_registry_registration():
     registry.register("test_func", func, schema)
     assert registry.get_function("test_func") == func
     assert registry.get_schema("test_func") is not None
+    entry = registry.get_entry("test_func")
+    assert entry[:2] == (func, registry.get_schema("test_func"))
+    assert callable(entry[2])
+    assert registry.get_entry("non_existent") is None
 
     # Test duplicate registration
     with pytest.raises(ValidationError):
@@ -144,6 +149,12 @@ def test_function_retry_logic():
         caller.call_function("retry_func", {}, max_retries=2)
     assert mock_func.call_count == 2
 
+    # Test that a single attempt propagates the original exception
+    mock_func.reset_mock()
+    with pytest.raises(ValueError):
+        caller.call_function("retry_func", {}, max_retries=1)
+    assert mock_func.call_count == 1
+
 def test_system_prompt_updates():
     """Test that system prompt updates correctly with function changes."""
     registry = FunctionRegistry()
@@ -181,4 +192,86 @@ def test_function_validation():
 
     # Test invalid parameter value
     with pytest.raises(ValidationError):
-        caller.call_function("test_func", {"name": "Alice", "age": -1}) 
\ No newline at end of file
+        caller.call_function("test_func", {"name": "Alice", "age": -1})
+
+def test_validation_failure_log_names_parameter(caplog):
+    """Test that the validation failure log identifies the failing parameter."""
+    registry = FunctionRegistry()
+    caller = GemmaFunctionCaller(registry)
+    func, schema = create_test_function()
+    caller.register_function("test_func", func, schema)
+
+    with pytest.raises(ValidationError) as excinfo:
+        caller.call_function("test_func", {"name": "Alice", "age": -1})
+    assert excinfo.value.param == "age"
+    assert "parameter 'age'" in caplog.text
+
+def test_system_prompt_tracks_registry_changes():
+    """Test that the system prompt reflects changes made directly on the registry."""
+    registry = FunctionRegistry()
+    caller = GemmaFunctionCaller(registry)
+    func, schema = create_test_function()
+
+    registry.register("test_func", func, schema)
+    assert caller.get_system_prompt() == "Available functions:\n\n- test_func: A test function\n"
+
+    updated_schema = dict(schema, description="Updated test function")
+    registry.update_function("test_func", func, updated_schema)
+    assert "Updated test function" in caller.get_system_prompt()
+
+    registry.unregister("test_func")
+    assert caller.get_system_prompt() == "No functions are currently available."
+
+def test_list_functions():
+    """Test listing registered functions."""
+    registry = FunctionRegistry()
+    func, schema = create_test_function()
+    assert registry.list_functions() == ()
+
+    registry.register("test_func", func, schema)
+    listing = registry.list_functions()
+    assert listing == (("test_func", "A test function"),)
+    assert registry.list_functions() is listing
+
+    registry.unregister("test_func")
+    assert registry.list_functions() == ()
+
+def test_register_prevalidated_schema():
+    """Test that validated=True skips re-validating the schema."""
+    registry = FunctionRegistry()
+    func, schema = create_test_function()
+
+    with patch("function_calling.FunctionValidator.validate_function_definition") as validate:
+        registry.register("test_func", func, schema, validated=True)
+        registry.update_function("test_func", func, schema, validated=True)
+        validate.assert_not_called()
+
+        registry.update_function("test_func", func, schema)
+        validate.assert_called_once_with(schema)
+
+@pytest.mark.asyncio
+async def test_call_function_async():
+    """Test calling functions through an executor."""
+    registry = FunctionRegistry()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        caller = GemmaFunctionCaller(registry, executor=executor)
+        func, schema = create_test_function()
+        caller.register_function("test_func", func, schema)
+
+        result = await caller.call_function_async("test_func", {"name": "Alice", "age": 25})
+        assert result == "Hello, Alice! You are 25 years old."
+
+        with pytest.raises(ValidationError):
+            await caller.call_function_async("test_func", {"name": "Alice", "age": -1})
+
+        with pytest.raises(ValueError):
+            await caller.call_function_async("non_existent", {})
+
+        mock_func = Mock(side_effect=[ValueError, "success"])
+        caller.register_function("retry_func", mock_func, {
+            "name": "retry_func",
+            "description": "A function to test retry logic",
+            "parameters": {}
+        })
+        assert await caller.call_function_async("retry_func", {}, max_retries=2) == "success"
+        assert mock_func.call_count == 2
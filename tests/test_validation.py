@@ -1,4 +1,8 @@
+import os
+import subprocess
+import sys
 import pytest
+import validation
 from validation import (
     ParameterType,
     ValidationError,
@@ -38,8 +42,11 @@ def test_parameter_schema_validation():
         maximum=100
     )
     number_schema.validate(50)
+    number_schema.validate(50.5)
     with pytest.raises(ValidationError):
         number_schema.validate("50")
+    with pytest.raises(ValidationError):
+        number_schema.validate(True)
     with pytest.raises(ValidationError):
         number_schema.validate(-1)
     with pytest.raises(ValidationError):
@@ -98,6 +105,18 @@ def test_parameter_schema_validation():
     enum_schema.validate("red")
     with pytest.raises(ValidationError):
         enum_schema.validate("yellow")
+    with pytest.raises(ValidationError):
+        enum_schema.validate(["red"])
+
+    # Unhashable enum values still work
+    list_enum_schema = ParameterSchema(
+        type=ParameterType.ENUM,
+        description="An enum of lists",
+        enum_values=[[1, 2], [3]]
+    )
+    list_enum_schema.validate([3])
+    with pytest.raises(ValidationError):
+        list_enum_schema.validate([4])
 
 def test_function_schema_validation():
     """Test function schema validation."""
@@ -125,7 +144,7 @@ def test_function_schema_validation():
     })
 
     # Test missing required parameter
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValidationError, match=r"Required parameter\(s\) missing: \['param1'\]"):
         schema.validate_parameters({
             "param2": 42
         })
@@ -203,4 +222,211 @@ def test_create_schema_from_parameters():
     with pytest.raises(ValidationError):
         FunctionValidator.create_schema_from_parameters({
             "invalid": lambda x: x
-        }) 
\ No newline at end of file
+        })
+
+def test_compiled_validator_matches_function_schema():
+    """Test that compiled validators accept and reject the same payloads as FunctionSchema."""
+    definition = {
+        "name": "test_function",
+        "description": "A test function",
+        "parameters": {
+            "name": {
+                "type": ParameterType.STRING.value,
+                "description": "Name",
+                "pattern": r"^[A-Za-z]+$"
+            },
+            "age": {
+                "type": ParameterType.NUMBER.value,
+                "description": "Age",
+                "minimum": 0,
+                "maximum": 150
+            },
+            "active": {
+                "type": ParameterType.BOOLEAN.value,
+                "description": "Active flag"
+            },
+            "tags": {
+                "type": ParameterType.ARRAY.value,
+                "description": "Tags",
+                "items": {"type": ParameterType.STRING.value, "description": "Tag"}
+            },
+            "address": {
+                "type": ParameterType.OBJECT.value,
+                "description": "Address",
+                "properties": {
+                    "zip": {"type": ParameterType.NUMBER.value, "description": "Zip", "minimum": 0}
+                }
+            },
+            "color": {
+                "type": ParameterType.ENUM.value,
+                "description": "Color",
+                "enum_values": ["red", "green"]
+            }
+        },
+        "required": ["name"]
+    }
+    schema = FunctionSchema(**definition)
+    validator = FunctionValidator.compile_validator(definition)
+
+    payloads = [
+        {"name": "Alice", "age": 30, "active": True, "tags": ["a"], "address": {"zip": 1}, "color": "red"},
+        {"name": "Alice", "age": None},
+        {"age": 30},
+        {"name": "Alice1"},
+        {"name": 42},
+        {"name": "Alice", "age": -1},
+        {"name": "Alice", "age": 151},
+        {"name": "Alice", "age": True},
+        {"name": "Alice", "active": 1},
+        {"name": "Alice", "tags": "a"},
+        {"name": "Alice", "tags": ["a", 1]},
+        {"name": "Alice", "address": []},
+        {"name": "Alice", "address": {"zip": -1}},
+        {"name": "Alice", "color": "blue"},
+        {"name": "Alice", "color": ["red"]},
+        {"name": "Alice", "unknown": 1},
+        # Several invalid values: the first one in call order is reported
+        {"color": "blue", "age": -1, "name": "Alice"},
+        {"age": -1, "name": 42},
+    ]
+    for payload in payloads:
+        try:
+            schema.validate_parameters(payload)
+            expected = None
+        except ValidationError as e:
+            expected = (str(e), getattr(e, "__notes__", None), e.param)
+        try:
+            validator(payload)
+            actual = None
+        except ValidationError as e:
+            actual = (str(e), getattr(e, "__notes__", None), e.param)
+        assert actual == expected, payload
+
+def test_parameter_errors_name_the_parameter(monkeypatch):
+    """Test that parameter errors expose .param with and without exception notes."""
+    definition = {
+        "name": "test_function",
+        "description": "A test function",
+        "parameters": {
+            "age": {"type": ParameterType.NUMBER.value, "description": "Age", "minimum": 0}
+        }
+    }
+    schema = FunctionSchema(**definition)
+    validator = FunctionValidator.compile_validator(definition)
+
+    for has_add_note, message in ((True, "Value -1 is less than minimum 0"),
+                                  (False, "Invalid value for parameter 'age': Value -1 is less than minimum 0")):
+        if has_add_note and sys.version_info < (3, 11):
+            continue
+        monkeypatch.setattr(validation, "_HAS_ADD_NOTE", has_add_note)
+        for check in (schema.validate_parameters, validator):
+            with pytest.raises(ValidationError) as excinfo:
+                check({"age": -1})
+            assert str(excinfo.value) == message
+            assert excinfo.value.param == "age"
+
+    with pytest.raises(ValidationError) as excinfo:
+        validator({"unknown": 1})
+    assert excinfo.value.param is None
+
+def test_compiled_validator_cache():
+    """Test that identical definitions share a compiled validator."""
+    def make_definition():
+        return {
+            "name": "test_function",
+            "description": "A test function",
+            "parameters": {
+                "param1": {"type": "string", "description": "First parameter"}
+            },
+            "required": ["param1"]
+        }
+
+    validator = FunctionValidator.compile_validator(make_definition())
+    assert FunctionValidator.compile_validator(make_definition()) is validator
+
+    changed = make_definition()
+    changed["parameters"]["param1"]["type"] = "number"
+    assert FunctionValidator.compile_validator(changed) is not validator
+
+    # Unhashable contents fall back to an uncached compile
+    unhashable = make_definition()
+    unhashable["parameters"]["param2"] = {
+        "type": "enum",
+        "description": "Second parameter",
+        "enum_values": [{1, 2}]
+    }
+    FunctionValidator.compile_validator(unhashable)({"param1": "x", "param2": {1, 2}})
+
+def test_validate_numeric_batch():
+    """Test batch range checks for numeric values."""
+    FunctionValidator.validate_numeric_batch([0, 5.5, 10], minimum=0, maximum=10)
+    FunctionValidator.validate_numeric_batch([])
+    with pytest.raises(ValidationError, match="less than minimum"):
+        FunctionValidator.validate_numeric_batch([1, -1, 11], minimum=0, maximum=10)
+    with pytest.raises(ValidationError, match="greater than maximum"):
+        FunctionValidator.validate_numeric_batch([1, 11, -1], minimum=0, maximum=10)
+
+    with pytest.raises(ValidationError, match=f"Value {2**53 + 1} is greater than maximum {2**53}"):
+        FunctionValidator.validate_numeric_batch([1, 2**53 + 1], maximum=2**53)
+    for values in ([1, "x"], [1, None], [True], ["x"] * 2000):
+        with pytest.raises(ValidationError, match="Expected number"):
+            FunctionValidator.validate_numeric_batch(values, minimum=0)
+
+def test_import_does_not_load_numpy():
+    """Test that importing validation leaves numpy unloaded until validate_batch needs it."""
+    code = "import sys, validation; print('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.strip() == "False"
+
+def test_function_schema_validate_batch():
+    """Test batch validation of parameter dicts."""
+    schema = FunctionSchema(
+        name="test_function",
+        description="A test function",
+        parameters={
+            "label": {
+                "type": ParameterType.STRING.value,
+                "description": "Label"
+            },
+            "score": {
+                "type": ParameterType.NUMBER.value,
+                "description": "Score",
+                "minimum": 0,
+                "maximum": 1
+            }
+        },
+        required=["label"]
+    )
+    records = [{"label": f"row{i}", "score": i / 1000} for i in range(1000)]
+    schema.validate_batch(records)
+    schema.validate_batch([])
+
+    # Errors match validating the records one by one
+    for record in ({"label": "bad", "score": "high"}, {"label": "bad", "score": 2}, {"score": 0.5}):
+        batch = records + [record]
+        with pytest.raises(ValidationError) as expected:
+            for row in batch:
+                schema.validate_parameters(row)
+        with pytest.raises(ValidationError) as actual:
+            schema.validate_batch(batch)
+        assert str(actual.value) == str(expected.value)
+
+    # Ints beyond float64 precision are compared exactly
+    big = FunctionSchema(
+        name="test_function",
+        description="A test function",
+        parameters={"x": {"type": ParameterType.NUMBER.value, "description": "X", "maximum": 2**53}}
+    )
+    big.validate_batch([{"x": 2**53}])
+    with pytest.raises(ValidationError, match=f"Value {2**53 + 1} is greater than maximum {2**53}"):
+        big.validate_batch([{"x": 2**53 + 1}])
+
+def test_schemas_use_slots():
+    """Test that schema instances carry no per-instance __dict__."""
+    parameter = ParameterSchema(type=ParameterType.STRING, description="A string parameter")
+    function = FunctionSchema(name="test_function", description="A test function", parameters={})
+    assert not hasattr(parameter, "__dict__")
+    assert not hasattr(function, "__dict__")
+    with pytest.raises(AttributeError):
+        parameter.extra = True
@@ -11,63 +11,86 @@ from examples.weather_example import (
     create_forecast_function
 )
 
-@pytest.fixture
-def mock_weather_data():
-    """Mock weather data fixture."""
-    return {
+_BASE_URL = "http://api.openweathermap.org/data/2.5"
+
+# Mock API payloads, built once at import. Tests treat them as read-only;
+# copy.deepcopy at the use site before mutating.
+_MOCK_WEATHER_DATA = {
+    "name": "London",
+    "sys": {"country": "GB"},
+    "main": {
+        "temp": 15.6,
+        "feels_like": 14.8,
+        "humidity": 76
+    },
+    "weather": [
+        {"description": "scattered clouds"}
+    ]
+}
+
+_MOCK_FORECAST_DATA = {
+    "city": {
         "name": "London",
-        "sys": {"country": "GB"},
-        "main": {
-            "temp": 15.6,
-            "feels_like": 14.8,
-            "humidity": 76
+        "country": "GB"
+    },
+    "list": [
+        {
+            "dt": 1617235200,  # 2021-04-01 00:00:00
+            "main": {
+                "temp": 12.3
+            },
+            "weather": [
+                {"description": "clear sky"}
+            ]
         },
-        "weather": [
-            {"description": "scattered clouds"}
-        ]
-    }
+        {
+            "dt": 1617246000,  # 2021-04-01 03:00:00
+            "main": {
+                "temp": 10.5
+            },
+            "weather": [
+                {"description": "clear sky"}
+            ]
+        }
+    ]
+}
+
+@pytest.fixture(scope="session")
+def mock_weather_data():
+    """Mock weather data fixture."""
+    return _MOCK_WEATHER_DATA
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_forecast_data():
     """Mock forecast data fixture."""
-    return {
-        "city": {
-            "name": "London",
-            "country": "GB"
-        },
-        "list": [
-            {
-                "dt": 1617235200,  # 2021-04-01 00:00:00
-                "main": {
-                    "temp": 12.3
-                },
-                "weather": [
-                    {"description": "clear sky"}
-                ]
-            },
-            {
-                "dt": 1617246000,  # 2021-04-01 03:00:00
-                "main": {
-                    "temp": 10.5
-                },
-                "weather": [
-                    {"description": "clear sky"}
-                ]
-            }
-        ]
-    }
+    return _MOCK_FORECAST_DATA
 
 @pytest.fixture
+def mocked_api(mocked_responses):
+    """Register the stock weather and forecast payloads on the HTTP mock.
+
+    Tests needing a different response override it with mocked_api.replace().
+    """
+    mocked_responses.add(responses.GET, f"{_BASE_URL}/weather", json=_MOCK_WEATHER_DATA, status=200)
+    mocked_responses.add(responses.GET, f"{_BASE_URL}/forecast", json=_MOCK_FORECAST_DATA, status=200)
+    return mocked_responses
+
+@pytest.fixture(scope="session")
 def api_key():
-    """Set up and tear down the API key environment variable."""
+    """Set the API key environment variable once for the whole session."""
     with patch.dict(os.environ, {"OPENWEATHERMAP_API_KEY": "test_key"}):
         yield "test_key"
 
+@pytest.fixture(scope="session")
+def api(api_key):
+    """WeatherAPI client shared across the session."""
+    return WeatherAPI()
+
 def test_weather_api_initialization(api_key):
     """Test WeatherAPI initialization."""
     api = WeatherAPI()
     assert api.api_key == "test_key"
-    assert api.base_url == "http://api.openweathermap.org/data/2.5"
+    assert api.base_url == _BASE_URL
 
 def test_weather_api_initialization_no_key():
     """Test WeatherAPI initialization without API key."""
@@ -75,135 +98,68 @@ def test_weather_api_initialization_no_key():
         with pytest.raises(ValueError):
             WeatherAPI()
 
-@responses.activate
-def test_get_weather(api_key):
+def test_get_weather(mocked_api, api):
     """Test getting current weather."""
-    api = WeatherAPI()
-    mock_response = {
-        "name": "London",
-        "sys": {"country": "GB"},
-        "main": {"temp": 15.6},
-        "weather": [{"description": "cloudy"}]
-    }
-
-    responses.add(
-        responses.GET,
-        "http://api.openweathermap.org/data/2.5/weather",
-        json=mock_response,
-        status=200
-    )
-
     result = api.get_weather("London")
-    assert result == mock_response
+    assert result == _MOCK_WEATHER_DATA
 
-@responses.activate
-def test_get_forecast(api_key):
+def test_get_forecast(mocked_api, api):
     """Test getting weather forecast."""
-    api = WeatherAPI()
-    mock_response = {
-        "city": {"name": "London"},
-        "list": [{"dt": 1617235200, "main": {"temp": 15.6}}]
-    }
-
-    responses.add(
-        responses.GET,
-        "http://api.openweathermap.org/data/2.5/forecast",
-        json=mock_response,
-        status=200
-    )
-
     result = api.get_forecast("London", days=1)
-    assert result == mock_response
-
-def test_format_weather_response(mock_weather_data):
-    """Test formatting weather response."""
-    formatted = format_weather_response(mock_weather_data, "metric")
-    assert "London, GB" in formatted
-    assert "15.6°C" in formatted
-    assert "14.8°C" in formatted
-    assert "76%" in formatted
-    assert "scattered clouds" in formatted
-
-def test_format_forecast_response(mock_forecast_data):
-    """Test formatting forecast response."""
-    formatted = format_forecast_response(mock_forecast_data, "metric")
-    assert "London, GB" in formatted
-    assert "2021-04-01" in formatted
-    assert "11.4°C" in formatted  # Average of 12.3 and 10.5
-    assert "clear sky" in formatted
-
-def test_create_weather_function(api_key):
-    """Test creating weather function."""
-    api = WeatherAPI()
-    weather_func = create_weather_function(api)
-
-    assert "function" in weather_func
-    assert "schema" in weather_func
-    schema = weather_func["schema"]
-    assert schema["name"] == "get_weather"
-    assert "location" in schema["parameters"]
-    assert "unit" in schema["parameters"]
-    assert schema["required"] == ["location"]
-
-def test_create_forecast_function(api_key):
-    """Test creating forecast function."""
-    api = WeatherAPI()
-    forecast_func = create_forecast_function(api)
-
-    assert "function" in forecast_func
-    assert "schema" in forecast_func
-    schema = forecast_func["schema"]
-    assert schema["name"] == "get_forecast"
-    assert "location" in schema["parameters"]
-    assert "days" in schema["parameters"]
-    assert "unit" in schema["parameters"]
+    assert result == _MOCK_FORECAST_DATA
+
+@pytest.mark.parametrize("formatter, data_fixture, expected_substrings", [
+    (format_weather_response, "mock_weather_data",
+     ["London, GB", "15.6°C", "14.8°C", "76%", "scattered clouds"]),
+    (format_forecast_response, "mock_forecast_data",
+     ["London, GB", "2021-04-01", "11.4°C", "clear sky"]),  # 11.4 is the average of 12.3 and 10.5
+])
+def test_format_response(request, formatter, data_fixture, expected_substrings):
+    """Test formatting weather and forecast responses."""
+    formatted = formatter(request.getfixturevalue(data_fixture), "metric")
+    for expected in expected_substrings:
+        assert expected in formatted
+
+@pytest.mark.parametrize("factory, expected_name, expected_params", [
+    (create_weather_function, "get_weather", ["location", "unit"]),
+    (create_forecast_function, "get_forecast", ["location", "days", "unit"]),
+])
+def test_create_function(api, factory, expected_name, expected_params):
+    """Test creating weather and forecast functions."""
+    created = factory(api)
+
+    assert "function" in created
+    assert "schema" in created
+    schema = created["schema"]
+    assert schema["name"] == expected_name
+    for param in expected_params:
+        assert param in schema["parameters"]
     assert schema["required"] == ["location"]
 
-@responses.activate
-def test_weather_function_integration(api_key, mock_weather_data):
+def test_weather_function_integration(mocked_api, api):
     """Test weather function integration."""
-    api = WeatherAPI()
     weather_func = create_weather_function(api)
 
-    responses.add(
-        responses.GET,
-        "http://api.openweathermap.org/data/2.5/weather",
-        json=mock_weather_data,
-        status=200
-    )
-
     result = weather_func["function"]("London", "metric")
     assert isinstance(result, str)
     assert "London" in result
     assert "15.6°C" in result
 
-@responses.activate
-def test_forecast_function_integration(api_key, mock_forecast_data):
+def test_forecast_function_integration(mocked_api, api):
     """Test forecast function integration."""
-    api = WeatherAPI()
     forecast_func = create_forecast_function(api)
 
-    responses.add(
-        responses.GET,
-        "http://api.openweathermap.org/data/2.5/forecast",
-        json=mock_forecast_data,
-        status=200
-    )
-
     result = forecast_func["function"]("London", 1, "metric")
     assert isinstance(result, str)
     assert "London" in result
     assert "2021-04-01" in result
 
-@responses.activate
-def test_api_error_handling(api_key):
+def test_api_error_handling(mocked_api, api):
     """Test API error handling."""
-    api = WeatherAPI()
-
     # Test 404 error
-    responses.add(
+    mocked_api.replace(
         responses.GET,
-        "http://api.openweathermap.org/data/2.5/weather",
+        f"{_BASE_URL}/weather",
         json={"message": "City not found"},
         status=404
     )
@@ -212,11 +168,11 @@ def test_api_error_handling(api_key):
         api.get_weather("NonexistentCity")
 
     # Test network error
-    responses.add(
+    mocked_api.replace(
         responses.GET,
-        "http://api.openweathermap.org/data/2.5/forecast",
+        f"{_BASE_URL}/forecast",
         body=requests.RequestException()
     )
 
     with pytest.raises(requests.RequestException):
-        api.get_forecast("London") 
\ No newline at end of file
+        api.get_forecast("London")
@@ -1,11 +1,47 @@
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+import functools
 import re
+import sys
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# float64 represents every int exactly only below this magnitude
+_FLOAT64_EXACT_LIMIT = 2 ** 53
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """Import numpy on first use; None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _intern(name: Any) -> Any:
+    """Intern string parameter names so dict probes can short-circuit on identity."""
+    return sys.intern(name) if type(name) is str else name
+
+def _enum_lookup(enum_values: List[Any]) -> Union[frozenset, tuple]:
+    """Build an O(1) membership set for enum values, or a tuple if any are unhashable."""
+    try:
+        return frozenset(enum_values)
+    except TypeError:
+        return tuple(enum_values)
+
+def _in_enum(value: Any, lookup: Union[frozenset, tuple]) -> bool:
+    try:
+        return value in lookup
+    except TypeError:
+        # An unhashable value cannot equal any member of a frozenset
+        return False
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern":
+    """Compile a regex pattern once and share it across schemas."""
+    return re.compile(pattern)
+
 class ParameterType(Enum):
     STRING = "string"
     NUMBER = "number"
@@ -14,12 +50,53 @@ class ParameterType(Enum):
     OBJECT = "object"
     ENUM = "enum"
 
+# ParameterType members by string value, skipping the Enum call protocol
+_PT_BY_VALUE = {pt.value: pt for pt in ParameterType}
+
+# Accepted values for a parameter's "type": enum members or their string values
+_VALID_TYPES = frozenset(ParameterType) | frozenset(pt.value for pt in ParameterType)
+
+# Exact Python types inferred by create_schema_from_parameters
+_TYPE_MAP = {
+    str: ParameterType.STRING,
+    bool: ParameterType.BOOLEAN,
+    int: ParameterType.NUMBER,
+    float: ParameterType.NUMBER,
+    list: ParameterType.ARRAY,
+    dict: ParameterType.OBJECT,
+}
+
 class ValidationError(Exception):
-    """Custom exception for validation errors."""
-    pass
+    """Custom exception for validation errors.
+
+    param names the parameter whose value failed validation, or is None for
+    errors that are not about a single parameter value.
+    """
+    param: Optional[str] = None
+
+# Python 3.11+ attaches the failing parameter as an exception note instead of
+# wrapping the error in a second ValidationError
+_HAS_ADD_NOTE = sys.version_info >= (3, 11)
+
+def _parameter_error(error: ValidationError, param_name: str) -> ValidationError:
+    """Tag error with its parameter as .param, plus a note (3.11+) or message prefix."""
+    if _HAS_ADD_NOTE:
+        error.add_note(f"parameter '{param_name}'")
+    else:
+        error = ValidationError(f"Invalid value for parameter '{param_name}': {error}")
+    error.param = param_name
+    return error
 
 class ParameterSchema:
-    """Schema for validating function parameters."""
+    """Schema for validating function parameters.
+
+    Instances use __slots__ and have no __dict__; new attributes (including
+    ones set by subclasses) must be added to the slot list.
+    """
+    __slots__ = ("type", "description", "required", "minimum", "maximum",
+                 "pattern", "_pattern_re", "enum_values", "_enum_lookup", "items", "properties",
+                 "_items_validator", "_prop_validators", "_validate_impl", "_none_ok")
+
     def __init__(self, 
                  type: Union[str, ParameterType],
                  description: str,
@@ -30,66 +107,104 @@ class ParameterSchema:
                  enum_values: Optional[List[Any]] = None,
                  items: Optional[Dict[str, Any]] = None,
                  properties: Optional[Dict[str, Any]] = None):
-        self.type = ParameterType(type) if isinstance(type, str) else type
+        if isinstance(type, str):
+            # Unknown strings fall through to ParameterType() for its ValueError
+            self.type = _PT_BY_VALUE.get(type) or ParameterType(type)
+        else:
+            self.type = type
         self.description = description
         self.required = required
         self.minimum = minimum
         self.maximum = maximum
         self.pattern = pattern
+        self._pattern_re = _compile_pattern(pattern) if pattern else None
         self.enum_values = enum_values
+        self._enum_lookup = _enum_lookup(enum_values) if enum_values is not None else None
         self.items = items
         self.properties = properties
+        self._items_validator = ParameterSchema(**items) if items else None
+        self._prop_validators = {
+            prop_name: ParameterSchema(**prop_schema)
+            for prop_name, prop_schema in (properties or {}).items()
+        }
+        self._validate_impl = _VALIDATORS[self.type]
+        self._none_ok = not required
 
     def validate(self, value: Any) -> None:
         """Validate a parameter value against the schema."""
         if value is None:
-            if self.required:
-                raise ValidationError(f"Required parameter is missing")
-            return
-
-        if self.type == ParameterType.STRING:
-            if not isinstance(value, str):
-                raise ValidationError(f"Expected string, got {type(value)}")
-            if self.pattern and not re.match(self.pattern, value):
-                raise ValidationError(f"String does not match pattern: {self.pattern}")
-
-        elif self.type == ParameterType.NUMBER:
-            if not isinstance(value, (int, float)):
-                raise ValidationError(f"Expected number, got {type(value)}")
-            if self.minimum is not None and value < self.minimum:
-                raise ValidationError(f"Value {value} is less than minimum {self.minimum}")
-            if self.maximum is not None and value > self.maximum:
-                raise ValidationError(f"Value {value} is greater than maximum {self.maximum}")
-
-        elif self.type == ParameterType.BOOLEAN:
-            if not isinstance(value, bool):
-                raise ValidationError(f"Expected boolean, got {type(value)}")
-
-        elif self.type == ParameterType.ARRAY:
-            if not isinstance(value, list):
-                raise ValidationError(f"Expected array, got {type(value)}")
-            if self.items:
-                item_validator = ParameterSchema(**self.items)
-                for item in value:
-                    item_validator.validate(item)
-
-        elif self.type == ParameterType.OBJECT:
-            if not isinstance(value, dict):
-                raise ValidationError(f"Expected object, got {type(value)}")
-            if self.properties:
-                for prop_name, prop_schema in self.properties.items():
-                    if prop_name in value:
-                        prop_validator = ParameterSchema(**prop_schema)
-                        prop_validator.validate(value[prop_name])
-
-        elif self.type == ParameterType.ENUM:
-            if self.enum_values is None:
-                raise ValidationError("Enum values not specified in schema")
-            if value not in self.enum_values:
-                raise ValidationError(f"Value {value} not in enum values: {self.enum_values}")
+            if self._none_ok:
+                return
+            raise ValidationError("Required parameter is missing")
+
+        self._validate_impl(self, value)
+
+def _validate_string(schema: ParameterSchema, value: Any) -> None:
+    if not isinstance(value, str):
+        raise ValidationError(f"Expected string, got {type(value)}")
+    if schema._pattern_re is not None and not schema._pattern_re.match(value):
+        raise ValidationError(f"String does not match pattern: {schema.pattern}")
+
+def _is_number(value: Any) -> bool:
+    """True for ints and floats, excluding bools."""
+    # Exact-type check first: skips the isinstance MRO walk for plain literals
+    t = type(value)
+    if t is int or t is float:
+        return True
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _validate_number(schema: ParameterSchema, value: Any) -> None:
+    if not _is_number(value):
+        raise ValidationError(f"Expected number, got {type(value)}")
+    if schema.minimum is not None and value < schema.minimum:
+        raise ValidationError(f"Value {value} is less than minimum {schema.minimum}")
+    if schema.maximum is not None and value > schema.maximum:
+        raise ValidationError(f"Value {value} is greater than maximum {schema.maximum}")
+
+def _validate_boolean(schema: ParameterSchema, value: Any) -> None:
+    if not isinstance(value, bool):
+        raise ValidationError(f"Expected boolean, got {type(value)}")
+
+def _validate_array(schema: ParameterSchema, value: Any) -> None:
+    if not isinstance(value, list):
+        raise ValidationError(f"Expected array, got {type(value)}")
+    item_validator = schema._items_validator
+    if item_validator is not None:
+        for item in value:
+            item_validator.validate(item)
+
+def _validate_object(schema: ParameterSchema, value: Any) -> None:
+    if not isinstance(value, dict):
+        raise ValidationError(f"Expected object, got {type(value)}")
+    for prop_name, prop_validator in schema._prop_validators.items():
+        if prop_name in value:
+            prop_validator.validate(value[prop_name])
+
+def _validate_enum(schema: ParameterSchema, value: Any) -> None:
+    if schema.enum_values is None:
+        raise ValidationError("Enum values not specified in schema")
+    if not _in_enum(value, schema._enum_lookup):
+        raise ValidationError(f"Value {value} not in enum values: {schema.enum_values}")
+
+# Type-specific validators, bound once per ParameterSchema instead of
+# re-dispatching on the type for every validate call
+_VALIDATORS: Dict[ParameterType, Callable[[ParameterSchema, Any], None]] = {
+    ParameterType.STRING: _validate_string,
+    ParameterType.NUMBER: _validate_number,
+    ParameterType.BOOLEAN: _validate_boolean,
+    ParameterType.ARRAY: _validate_array,
+    ParameterType.OBJECT: _validate_object,
+    ParameterType.ENUM: _validate_enum,
+}
 
 class FunctionSchema:
-    """Schema for validating function definitions."""
+    """Schema for validating function definitions.
+
+    Instances use __slots__ and have no __dict__; new attributes (including
+    ones set by subclasses) must be added to the slot list.
+    """
+    __slots__ = ("name", "description", "parameters", "required", "_param_names", "_param_get")
+
     def __init__(self, 
                  name: str,
                  description: str,
@@ -98,26 +213,243 @@ class FunctionSchema:
         self.name = name
         self.description = description
         self.parameters = {
-            name: ParameterSchema(**param_schema)
+            _intern(name): ParameterSchema(**param_schema)
             for name, param_schema in parameters.items()
         }
-        self.required = required or []
+        self.required = frozenset(_intern(name) for name in required or ())
+        self._param_names = frozenset(self.parameters)
+        self._param_get = self.parameters.get
 
     def validate_parameters(self, params: Dict[str, Any]) -> None:
         """Validate function parameters against the schema."""
-        # Check for required parameters
-        for param_name in self.required:
-            if param_name not in params:
-                raise ValidationError(f"Required parameter '{param_name}' is missing")
+        # Check for required and unknown parameters with set operations
+        missing = self.required - params.keys()
+        if missing:
+            raise ValidationError(f"Required parameter(s) missing: {sorted(missing)}")
+        unknown = params.keys() - self._param_names
+        if unknown:
+            param_name = next(name for name in params if name in unknown)
+            raise ValidationError(f"Unknown parameter: {param_name}")
 
-        # Validate each provided parameter
+        # Validate each provided parameter; all names are known at this point
+        param_get = self._param_get
         for param_name, param_value in params.items():
-            if param_name not in self.parameters:
-                raise ValidationError(f"Unknown parameter: {param_name}")
             try:
-                self.parameters[param_name].validate(param_value)
+                param_get(param_name).validate(param_value)
             except ValidationError as e:
-                raise ValidationError(f"Invalid value for parameter '{param_name}': {str(e)}")
+                raise _parameter_error(e, param_name)
+
+    def validate_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Validate a batch of parameter dicts, raising on the first invalid record.
+
+        With numpy installed, bounded number parameters are range-checked per
+        column in one vectorized pass. Any violation falls back to validating
+        record by record, so the error matches calling validate_parameters on
+        each record in order.
+        """
+        bounds = {
+            param_name: (param.minimum, param.maximum)
+            for param_name, param in self.parameters.items()
+            if param.type == ParameterType.NUMBER
+            and (param.minimum is not None or param.maximum is not None)
+        }
+        if not bounds or _numpy() is None or not self._batch_is_valid(records, bounds):
+            for record in records:
+                self.validate_parameters(record)
+
+    def _batch_is_valid(self, records: List[Dict[str, Any]],
+                        bounds: Dict[str, tuple]) -> bool:
+        """Vectorized fast path for validate_batch; False means re-check per record."""
+        np = _numpy()
+        columns: Dict[str, List[Any]] = {param_name: [] for param_name in bounds}
+        try:
+            for record in records:
+                if self.required - record.keys() or record.keys() - self._param_names:
+                    return False
+                for param_name, param_value in record.items():
+                    column = columns.get(param_name)
+                    value_type = type(param_value)
+                    # Ints float64 could round are checked exactly, one by one
+                    if column is not None and (value_type is float or (
+                            value_type is int and abs(param_value) < _FLOAT64_EXACT_LIMIT)):
+                        column.append(param_value)
+                    else:
+                        self.parameters[param_name].validate(param_value)
+
+            for param_name, values in columns.items():
+                if not values:
+                    continue
+                minimum, maximum = bounds[param_name]
+                column = np.asarray(values, dtype=np.float64)
+                if minimum is not None and np.any(column < minimum):
+                    return False
+                if maximum is not None and np.any(column > maximum):
+                    return False
+        except (ValidationError, OverflowError):
+            return False
+        return True
+
+class _ValidatorCodegen:
+    """Emit straight-line Python source for a function definition's validator.
+
+    Schema constants (bounds, patterns, enum values, names) are bound into
+    the namespace of the generated function rather than written as literals.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            "ValidationError": ValidationError,
+            "_in_enum": _in_enum,
+            "_parameter_error": _parameter_error,
+        }
+
+    def const(self, value: Any) -> str:
+        """Bind a constant into the generated namespace and return its name."""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def fail(self, indent: int, param: str, message: str) -> None:
+        """Emit a raise of message (f-string source) for the parameter name bound as param."""
+        self.emit(indent, f"raise _parameter_error(ValidationError(f{message!r}), {param})")
+
+    def function(self, schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+        required = frozenset(_intern(name) for name in schema.get("required") or ())
+        parameters = {
+            _intern(param_name): param_schema
+            for param_name, param_schema in schema["parameters"].items()
+        }
+
+        self.emit(0, "def _validate(params):")
+        self.emit(1, f"missing = {self.const(required)} - params.keys()")
+        self.emit(1, "if missing:")
+        self.emit(2, "raise ValidationError(f\"Required parameter(s) missing: {sorted(missing)}\")")
+        self.emit(1, f"unknown = params.keys() - {self.const(frozenset(parameters))}")
+        self.emit(1, "if unknown:")
+        self.emit(2, "param_name = next(name for name in params if name in unknown)")
+        self.emit(2, "raise ValidationError(f\"Unknown parameter: {param_name}\")")
+
+        # One check per parameter, run in call order like FunctionSchema
+        checks = {}
+        self.emit(1, f"checks = {self.const(checks)}")
+        self.emit(1, "for param_name, v0 in params.items():")
+        self.emit(2, "checks[param_name](v0)")
+
+        for index, (param_name, param_schema) in enumerate(parameters.items()):
+            param = self.const(param_name)
+            self.emit(0, f"def _check{index}(v0):")
+            self.parameter(param_schema, 0, 1, param)
+
+        exec(compile("\n".join(self.lines), "<validator>", "exec"), self.namespace)
+        for index, param_name in enumerate(parameters):
+            checks[param_name] = self.namespace[f"_check{index}"]
+        return self.namespace["_validate"]
+
+    def parameter(self, param_schema: Dict[str, Any], depth: int, indent: int, param: str) -> None:
+        """Emit checks mirroring ParameterSchema.validate for the value in v<depth>."""
+        var = f"v{depth}"
+        param_type = ParameterType(param_schema["type"])
+
+        if param_schema.get("required", False):
+            self.emit(indent, f"if {var} is None:")
+            self.fail(indent + 1, param, "Required parameter is missing")
+        else:
+            self.emit(indent, f"if {var} is not None:")
+            indent += 1
+
+        if param_type == ParameterType.STRING:
+            self.emit(indent, f"if not isinstance({var}, str):")
+            self.fail(indent + 1, param, f"Expected string, got {{type({var})}}")
+            pattern = param_schema.get("pattern")
+            if pattern:
+                self.emit(indent, f"if not {self.const(_compile_pattern(pattern))}.match({var}):")
+                self.fail(indent + 1, param, f"String does not match pattern: {{{self.const(pattern)}}}")
+
+        elif param_type == ParameterType.NUMBER:
+            self.emit(indent, f"t = type({var})")
+            self.emit(indent, f"if t is not int and t is not float and "
+                              f"(not isinstance({var}, (int, float)) or isinstance({var}, bool)):")
+            self.fail(indent + 1, param, f"Expected number, got {{type({var})}}")
+            minimum = param_schema.get("minimum")
+            if minimum is not None:
+                bound = self.const(minimum)
+                self.emit(indent, f"if {var} < {bound}:")
+                self.fail(indent + 1, param, f"Value {{{var}}} is less than minimum {{{bound}}}")
+            maximum = param_schema.get("maximum")
+            if maximum is not None:
+                bound = self.const(maximum)
+                self.emit(indent, f"if {var} > {bound}:")
+                self.fail(indent + 1, param, f"Value {{{var}}} is greater than maximum {{{bound}}}")
+
+        elif param_type == ParameterType.BOOLEAN:
+            self.emit(indent, f"if not isinstance({var}, bool):")
+            self.fail(indent + 1, param, f"Expected boolean, got {{type({var})}}")
+
+        elif param_type == ParameterType.ARRAY:
+            self.emit(indent, f"if not isinstance({var}, list):")
+            self.fail(indent + 1, param, f"Expected array, got {{type({var})}}")
+            items = param_schema.get("items")
+            if items:
+                self.emit(indent, f"for v{depth + 1} in {var}:")
+                self.parameter(items, depth + 1, indent + 1, param)
+
+        elif param_type == ParameterType.OBJECT:
+            self.emit(indent, f"if not isinstance({var}, dict):")
+            self.fail(indent + 1, param, f"Expected object, got {{type({var})}}")
+            for prop_name, prop_schema in (param_schema.get("properties") or {}).items():
+                key = self.const(prop_name)
+                self.emit(indent, f"if {key} in {var}:")
+                self.emit(indent + 1, f"v{depth + 1} = {var}[{key}]")
+                self.parameter(prop_schema, depth + 1, indent + 1, param)
+
+        else:
+            enum_values = param_schema.get("enum_values")
+            if enum_values is None:
+                self.fail(indent, param, "Enum values not specified in schema")
+            else:
+                lookup = self.const(_enum_lookup(enum_values))
+                self.emit(indent, f"if not _in_enum({var}, {lookup}):")
+                self.fail(indent + 1, param,
+                          f"Value {{{var}}} not in enum values: {{{self.const(list(enum_values))}}}")
+
+        # Keep every generated block non-empty
+        self.emit(indent, "pass")
+
+def _compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+    """Generate and compile a validator mirroring FunctionSchema.validate_parameters."""
+    return _ValidatorCodegen().function(schema)
+
+def _freeze(value: Any) -> Any:
+    """Convert a schema value into a hashable canonical form."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    # Tag scalars with their type so that e.g. 1, 1.0 and True stay distinct
+    return (type(value), value)
+
+class _SchemaKey:
+    """Cache key comparing function definitions by content rather than identity."""
+    __slots__ = ("schema", "_key", "_hash")
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self._key = _freeze(schema)
+        self._hash = hash(self._key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _SchemaKey) and self._key == other._key
+
+@functools.lru_cache(maxsize=128)
+def _cached_compile_validator(key: _SchemaKey) -> Callable[[Dict[str, Any]], None]:
+    return _compile_validator(key.schema)
 
 class FunctionValidator:
     """Validator for function definitions and calls."""
@@ -139,27 +471,50 @@ class FunctionValidator:
             if "description" not in param_schema:
                 raise ValidationError(f"Parameter '{param_name}' missing description")
 
-            try:
-                param_type = ParameterType(param_schema["type"])
-            except ValueError:
-                raise ValidationError(f"Invalid parameter type for '{param_name}': {param_schema['type']}")
+            param_type = param_schema["type"]
+            if not isinstance(param_type, (str, ParameterType)) or param_type not in _VALID_TYPES:
+                raise ValidationError(f"Invalid parameter type for '{param_name}': {param_type}")
+
+    @staticmethod
+    def compile_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+        """Compile a function definition into a specialized parameter validator.
+
+        The returned callable behaves like FunctionSchema.validate_parameters,
+        but types, patterns and bounds are resolved once instead of per call.
+        Validators are cached by schema content, so re-registering an
+        identical definition reuses the previously compiled validator.
+        """
+        try:
+            key = _SchemaKey(schema)
+        except TypeError:
+            # Unhashable or unsortable schema contents cannot be cached
+            return _compile_validator(schema)
+        return _cached_compile_validator(key)
+
+    @staticmethod
+    def validate_numeric_batch(values: Any,
+                               minimum: Optional[float] = None,
+                               maximum: Optional[float] = None) -> None:
+        """Check a batch of numbers, raising on the first invalid value."""
+        for value in values:
+            if not _is_number(value):
+                raise ValidationError(f"Expected number, got {type(value)}")
+            if minimum is not None and value < minimum:
+                raise ValidationError(f"Value {value} is less than minimum {minimum}")
+            if maximum is not None and value > maximum:
+                raise ValidationError(f"Value {value} is greater than maximum {maximum}")
 
     @staticmethod
     def create_schema_from_parameters(params: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a parameter schema from a dictionary of parameters."""
+        """Create a parameter schema from a dictionary of parameters.
+
+        Types are matched exactly, so subclasses of the built-in types (such
+        as OrderedDict or IntEnum members) are rejected as unsupported.
+        """
         schema = {}
         for param_name, param_value in params.items():
-            if isinstance(param_value, str):
-                param_type = ParameterType.STRING
-            elif isinstance(param_value, bool):
-                param_type = ParameterType.BOOLEAN
-            elif isinstance(param_value, (int, float)):
-                param_type = ParameterType.NUMBER
-            elif isinstance(param_value, list):
-                param_type = ParameterType.ARRAY
-            elif isinstance(param_value, dict):
-                param_type = ParameterType.OBJECT
-            else:
+            param_type = _TYPE_MAP.get(type(param_value))
+            if param_type is None:
                 raise ValidationError(f"Unsupported parameter type for '{param_name}': {type(param_value)}")
 
             schema[param_name] = {